@@ -5,15 +5,27 @@ Standalone test runner for dedupdir tests using unittest.
 Usage:
     ./tests/run_tests.py          # Run all tests
     ./tests/run_tests.py -v       # Run with verbose output
-    ./tests/run_tests.py TestClass.test_method  # Run specific test
+    ./tests/run_tests.py -j1      # Run serially in a single process
+    ./tests/run_tests.py TestClass.test_method  # Run tests whose id contains this
 """
 
 import sys
 import os
 import unittest
-import types
+import importlib.machinery
+import importlib.util
 import tempfile
 import shutil
+import uuid
+import copy
+import functools
+import collections
+import re
+import atexit
+import io
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -22,67 +34,293 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 
 def load_module_from_file(filepath, module_name):
-    """Load a Python module from a file without .py extension."""
+    """Load a Python module from a file without .py extension.
+
+    Uses SourceFileLoader so the compiled bytecode is cached in __pycache__
+    and reused by later runs, just like a regular import. If the same file
+    is already loaded under module_name, that module is returned as-is.
+    """
     filepath = Path(filepath)
+    existing = sys.modules.get(module_name)
+    if existing is not None and getattr(existing, '__file__', None) == str(filepath):
+        return existing
     if not filepath.exists():
         raise ImportError(f"Could not find {filepath}")
 
-    with open(filepath, 'r') as f:
-        code = f.read()
-
-    module = types.ModuleType(module_name)
-    module.__file__ = str(filepath)
+    loader = importlib.machinery.SourceFileLoader(module_name, str(filepath))
+    spec = importlib.util.spec_from_file_location(module_name, str(filepath), loader=loader)
+    module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
-    exec(code, module.__dict__)
+    loader.exec_module(module)
     return module
 
 
-# Load modules once
-DEDUPDIR = load_module_from_file(PROJECT_ROOT / "dedupdir", 'dedupdir')
-TUI_MODULE = load_module_from_file(PROJECT_ROOT / "dedupdir-tui", 'dedupdir_tui')
+class LazyModule:
+    """Proxy that calls load() to import a module on first attribute access.
+
+    Attribute assignment and deletion are forwarded to the loaded module, so
+    tests can patch attributes on the proxy as if it were the module.
+    """
+
+    def __init__(self, load):
+        object.__setattr__(self, '_load_func', load)
+        object.__setattr__(self, '_module', None)
+
+    def _load(self):
+        if self._module is None:
+            object.__setattr__(self, '_module', self._load_func())
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._load(), name)
+
+
+def _load_dedupdir():
+    return load_module_from_file(PROJECT_ROOT / "dedupdir", 'dedupdir')
+
+
+def _load_tui():
+    # Load dedupdir first so dedupdir-tui reuses it instead of loading its own copy
+    DEDUPDIR._load()
+    return load_module_from_file(PROJECT_ROOT / "dedupdir-tui", 'dedupdir_tui')
+
+
+# Modules are loaded on first use, so running a subset of tests only
+# pays for the modules those tests touch
+DEDUPDIR = LazyModule(_load_dedupdir)
+TUI_MODULE = LazyModule(_load_tui)
+
+
+# Fixture file contents, pre-encoded once
+DUPLICATE_CONTENT = b'duplicate content'
+UNIQUE1_CONTENT = b'unique to root1'
+UNIQUE2_CONTENT = b'unique to root2'
+CONTENT = b'content'
+CONTENT1 = b'content1'
+CONTENT2 = b'content2'
+NEW_CONTENT = b'new content'
+
+# Prefer tmpfs for fixtures so test file IO never touches a real disk.
+# Resolved once so mkdtemp() doesn't rescan TMPDIR and friends on every call.
+if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+    TMP_BASE = '/dev/shm'
+else:
+    TMP_BASE = tempfile.gettempdir()
+
+# Per-test directories are renamed in here on teardown and removed at exit
+GRAVEYARD = tempfile.mkdtemp(prefix='dedupdir_graveyard_', dir=TMP_BASE)
+atexit.register(shutil.rmtree, GRAVEYARD, ignore_errors=True)
+
+
+def bulk_write(tree):
+    """Write a {path: bytes} tree using raw os.open/os.write calls.
+
+    Files are grouped by parent directory. Each parent is created and opened
+    once, and its files are created relative to that directory fd, so the
+    kernel doesn't re-resolve the full path for every file. Each file is
+    written with a single write() and no text encoding layer. Files with
+    identical content are hardlinked to the first copy written rather than
+    written again; the links are made once every directory's writes have
+    finished, reusing the same directory fds. dedupdir hashes by content, so
+    links look exactly like duplicates. Tests that modify one of these files
+    must unlink it first.
+
+    Paths may be str or Path; they're handled as plain strings internally.
+    """
+    by_parent = {}
+    sources = {}
+    for path, data in tree.items():
+        # Normalize so link sources compare equal to os.path.join(parent, name)
+        path = os.path.normpath(os.fspath(path))
+        parent, name = os.path.split(path)
+        # A bare file name lives in the current directory
+        if not parent:
+            parent = os.curdir
+            path = os.path.join(parent, name)
+        by_parent.setdefault(parent, []).append((name, data))
+        sources.setdefault(data, path)
+
+    dir_fds = {}
+    try:
+        for parent, files in by_parent.items():
+            os.makedirs(parent, exist_ok=True)
+            dir_fds[parent] = dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+            for name, data in files:
+                if sources[data] == os.path.join(parent, name):
+                    fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600, dir_fd=dir_fd)
+                    try:
+                        os.write(fd, data)
+                    finally:
+                        os.close(fd)
+        for parent, files in by_parent.items():
+            for name, data in files:
+                source = sources[data]
+                if source != os.path.join(parent, name):
+                    os.link(source, name, dst_dir_fd=dir_fds[parent])
+    finally:
+        for dir_fd in dir_fds.values():
+            os.close(dir_fd)
+
+
+# Named view of the 7-tuple returned by find_duplicates()
+FindResult = collections.namedtuple('FindResult', [
+    'dir_stats', 'total_duplicates', 'total_files', 'file_to_hash',
+    'hash_to_dirs', 'dir_all_files', 'cached_hashes',
+])
+
+
+def shallow_hash_file(filepath, algorithm='blake2b', chunk_size=None):
+    """Cheap stand-in for dedupdir.hash_file(): file size plus the first 64 bytes.
+
+    Good enough to tell the small fixture files apart without computing a
+    real digest. Like hash_file(), returns None if the file can't be read.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            return f"{os.fstat(f.fileno()).st_size}:{f.read(64).hex()}"
+    except OSError:
+        return None
+
+
+def _copy_containers(value):
+    """Copy a dict/list/set and any dict/list/set directly inside it.
+
+    Anything else (keys, Paths, tuples, strings) is shared with the original.
+    """
+    if isinstance(value, dict):
+        copied = copy.copy(value)  # keeps defaultdict's default_factory
+        for key, item in copied.items():
+            if isinstance(item, (dict, list, set)):
+                copied[key] = copy.copy(item)
+        return copied
+    if isinstance(value, list):
+        return [copy.copy(item) if isinstance(item, (dict, list, set)) else item for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def clone_tui(tui):
+    """Return a copy of a scanned DedupdirTUI that can be mutated independently.
+
+    Much cheaper than scanning again. Every dict/list/set attribute is copied
+    two levels deep, which covers what trashing, undo and view navigation
+    modify; everything else is shared with the original.
+    """
+    clone = copy.copy(tui)
+    for name, value in vars(tui).items():
+        if isinstance(value, (dict, list, set)):
+            setattr(clone, name, _copy_containers(value))
+    return clone
 
 
 class TempDirMixin:
-    """Mixin providing temporary directory setup/teardown."""
+    """Mixin giving each test a temp dir copied from the FIXTURE_FILES template."""
+
+    NEEDS_TEMPDIR = True
+    PER_TEST_DIR = True
+    FIXTURE_FILES = None
+    SCAN_ROOTS = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if cls.SCAN_ROOTS and not (cls.FIXTURE_FILES and cls.NEEDS_TEMPDIR and cls.PER_TEST_DIR):
+            raise TypeError(f"{cls.__name__}: SCAN_ROOTS requires FIXTURE_FILES, "
+                            "NEEDS_TEMPDIR and PER_TEST_DIR")
+        cls.session_dir_str = None
+        cls.template_dir_str = None
+        if not cls.NEEDS_TEMPDIR:
+            return
+        cls.session_dir_str = tempfile.mkdtemp(prefix='dedupdir_test_', dir=TMP_BASE)
+        # Class cleanups still run if the rest of setUpClass raises
+        cls.addClassCleanup(shutil.rmtree, cls.session_dir_str, ignore_errors=True)
+        if cls.FIXTURE_FILES:
+            cls.template_dir_str = os.path.join(cls.session_dir_str, 'template')
+            bulk_write({os.path.join(cls.template_dir_str, rel_path): data
+                        for rel_path, data in cls.FIXTURE_FILES.items()})
+        if cls.SCAN_ROOTS:
+            work_dir_str = os.path.join(cls.session_dir_str, 'work')
+            shutil.copytree(cls.template_dir_str, work_dir_str, copy_function=os.link)
+            roots = [Path(os.path.join(work_dir_str, name)) for name in cls.SCAN_ROOTS]
+            cls._template_tui = TUI_MODULE.DedupdirTUI(roots, use_cache=False)
+            cls._template_tui.scan(quiet=True)
 
     def setUp(self):
-        self.temp_dir = Path(tempfile.mkdtemp(prefix='dedupdir_test_'))
+        if not self.NEEDS_TEMPDIR or not self.PER_TEST_DIR:
+            self.temp_dir = self.temp_dir_str = None
+            return
+        if self.SCAN_ROOTS:
+            self.temp_dir_str = os.path.join(self.session_dir_str, 'work')
+        else:
+            self.temp_dir_str = os.path.join(self.session_dir_str, f"t{uuid.uuid4().hex}")
+        if not os.path.exists(self.temp_dir_str):
+            if self.template_dir_str is not None:
+                shutil.copytree(self.template_dir_str, self.temp_dir_str, copy_function=os.link)
+            else:
+                os.mkdir(self.temp_dir_str)
+        self.temp_dir = Path(self.temp_dir_str)
+        if self.SCAN_ROOTS:
+            self.tui = clone_tui(self._template_tui)
+
+    def root_paths(self, *names):
+        """Return Paths for the named subdirectories of this test's temp dir."""
+        return tuple(Path(os.path.join(self.temp_dir_str, name)) for name in names)
 
     def tearDown(self):
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self.temp_dir_str is None:
+            return
+        # A single rename is cheaper than walking the tree to delete it now
+        name = f"t{uuid.uuid4().hex}" if self.SCAN_ROOTS else os.path.basename(self.temp_dir_str)
+        try:
+            os.rename(self.temp_dir_str, os.path.join(GRAVEYARD, name))
+        except OSError:
+            shutil.rmtree(self.temp_dir_str, ignore_errors=True)
 
 
 class TestFindDuplicates(TempDirMixin, unittest.TestCase):
-    """Tests for the find_duplicates function."""
-
-    def create_simple_test_dirs(self):
-        """Create simple test structure with duplicates."""
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
-
-        (root1 / 'duplicate.txt').write_text('duplicate content')
-        (root2 / 'duplicate.txt').write_text('duplicate content')
-        (root1 / 'unique1.txt').write_text('unique to root1')
-        (root2 / 'unique2.txt').write_text('unique to root2')
-
-        return root1, root2
+    """Tests for the find_duplicates function.
+
+    The tests only read the result, so the template tree is scanned once
+    for the whole class and the FindResult is shared.
+    """
+
+    PER_TEST_DIR = False
+    FIXTURE_FILES = {
+        'root1/duplicate.txt': DUPLICATE_CONTENT,
+        'root2/duplicate.txt': DUPLICATE_CONTENT,
+        'root1/unique1.txt': UNIQUE1_CONTENT,
+        'root2/unique2.txt': UNIQUE2_CONTENT,
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # These tests only check counts and grouping, not real digests
+        cls._real_hash_file = DEDUPDIR.hash_file
+        DEDUPDIR.hash_file = shallow_hash_file
+        cls.addClassCleanup(setattr, DEDUPDIR, 'hash_file', cls._real_hash_file)
+
+        cls.roots = tuple(Path(os.path.join(cls.template_dir_str, name)) for name in ('root1', 'root2'))
+        cls._dup_result = FindResult._make(
+            DEDUPDIR.find_duplicates(list(cls.roots), quiet=True, use_cache=False, jobs=1))
 
     def test_finds_duplicate_files(self):
         """Should identify files with identical content as duplicates."""
-        root1, root2 = self.create_simple_test_dirs()
-        result = DEDUPDIR.find_duplicates([root1, root2], quiet=True, use_cache=False, jobs=1)
-        dir_stats, total_dups, total_files, file_to_hash, hash_to_dirs, dir_all_files, _ = result
-
-        self.assertGreater(total_dups, 0)
-        self.assertEqual(total_files, 4)
+        self.assertGreater(self._dup_result.total_duplicates, 0)
+        self.assertEqual(self._dup_result.total_files, 4)
 
     def test_unique_files_not_duplicates(self):
         """Unique files should not be counted as duplicates."""
-        root1, root2 = self.create_simple_test_dirs()
-        result = DEDUPDIR.find_duplicates([root1, root2], quiet=True, use_cache=False, jobs=1)
-        _, _, _, file_to_hash, hash_to_dirs, _, _ = result
+        root1, root2 = self.roots
+        file_to_hash = self._dup_result.file_to_hash
+        hash_to_dirs = self._dup_result.hash_to_dirs
 
         unique1_path = root1 / 'unique1.txt'
         if unique1_path in file_to_hash:
@@ -93,25 +331,17 @@ class TestFindDuplicates(TempDirMixin, unittest.TestCase):
 class TestRedundancyScore(unittest.TestCase):
     """Tests for redundancy score calculation."""
 
-    def test_full_redundancy_is_1(self):
-        """Directory with all duplicates should be 1.0 (100%) redundant."""
-        score = DEDUPDIR.calculate_redundancy_score(10, 10)
-        self.assertEqual(score, 1.0)
-
-    def test_no_redundancy_is_0(self):
-        """Directory with no duplicates should be 0.0 redundant."""
-        score = DEDUPDIR.calculate_redundancy_score(0, 10)
-        self.assertEqual(score, 0.0)
-
-    def test_partial_redundancy(self):
-        """Partial redundancy should calculate correctly."""
-        score = DEDUPDIR.calculate_redundancy_score(5, 10)
-        self.assertEqual(score, 0.5)
-
-    def test_empty_directory_is_0(self):
-        """Empty directory should be 0.0 redundant."""
-        score = DEDUPDIR.calculate_redundancy_score(0, 0)
-        self.assertEqual(score, 0.0)
+    def test_redundancy_scores(self):
+        """Score should be duplicates / total, and 0.0 for an empty directory."""
+        cases = (
+            (10, 10, 1.0),  # all duplicates
+            (0, 10, 0.0),   # no duplicates
+            (5, 10, 0.5),   # partial redundancy
+            (0, 0, 0.0),    # empty directory
+        )
+        for duplicates, total, expected in cases:
+            with self.subTest(duplicates=duplicates, total=total):
+                self.assertEqual(DEDUPDIR.calculate_redundancy_score(duplicates, total), expected)
 
 
 class TestTUIInitialization(TempDirMixin, unittest.TestCase):
@@ -119,31 +349,24 @@ class TestTUIInitialization(TempDirMixin, unittest.TestCase):
 
     def test_tui_creates_with_single_root(self):
         """TUI should initialize with a single root directory."""
-        root = self.temp_dir / 'single'
-        root.mkdir()
-        (root / 'file.txt').write_text('content')
+        root, = self.root_paths('single')
+        bulk_write({root / 'file.txt': CONTENT})
 
         tui = TUI_MODULE.DedupdirTUI(root, use_cache=False)
         self.assertEqual(len(tui.root_paths), 1)
 
     def test_tui_creates_with_multiple_roots(self):
         """TUI should initialize with multiple root directories."""
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
-        (root1 / 'file.txt').write_text('content')
-        (root2 / 'file.txt').write_text('content')
+        root1, root2 = self.root_paths('root1', 'root2')
+        bulk_write({root1 / 'file.txt': CONTENT, root2 / 'file.txt': CONTENT})
 
         tui = TUI_MODULE.DedupdirTUI([root1, root2], use_cache=False)
         self.assertEqual(len(tui.root_paths), 2)
 
     def test_scan_populates_data_structures(self):
         """Scanning should populate all data structures."""
-        root = self.temp_dir / 'root'
-        root.mkdir()
-        (root / 'file1.txt').write_text('content1')
-        (root / 'file2.txt').write_text('content2')
+        root, = self.root_paths('root')
+        bulk_write({root / 'file1.txt': CONTENT1, root / 'file2.txt': CONTENT2})
 
         tui = TUI_MODULE.DedupdirTUI(root, use_cache=False)
         tui.scan(quiet=True)
@@ -156,64 +379,45 @@ class TestTUIInitialization(TempDirMixin, unittest.TestCase):
 class TestTrashOperations(TempDirMixin, unittest.TestCase):
     """Tests for trash functionality."""
 
-    def create_tui_with_files(self):
-        """Create TUI with test files."""
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
-
-        (root1 / 'duplicate.txt').write_text('duplicate content')
-        (root2 / 'duplicate.txt').write_text('duplicate content')
-        (root1 / 'unique1.txt').write_text('unique to root1')
-
-        tui = TUI_MODULE.DedupdirTUI([root1, root2], use_cache=False)
-        tui.scan(quiet=True)
-        return tui, root1, root2
-
-    def test_trash_item_moves_file(self):
-        """Trashing a file should move it to trash directory."""
-        tui, root1, root2 = self.create_tui_with_files()
+    FIXTURE_FILES = {
+        'root1/duplicate.txt': DUPLICATE_CONTENT,
+        'root2/duplicate.txt': DUPLICATE_CONTENT,
+        'root1/unique1.txt': UNIQUE1_CONTENT,
+    }
+    SCAN_ROOTS = ('root1', 'root2')
+
+    def test_trash_and_undo_flow(self):
+        """Trash should move the file and record undo; undo should restore it."""
+        root1, root2 = self.root_paths('root1', 'root2')
+        tui = self.tui
         file_to_trash = root1 / 'unique1.txt'
-
-        self.assertTrue(file_to_trash.exists())
-        tui.trash_item(file_to_trash, 'file')
-        self.assertFalse(file_to_trash.exists())
-
-    def test_trash_creates_undo_entry(self):
-        """Trashing should add entry to undo stack."""
-        tui, root1, root2 = self.create_tui_with_files()
-        file_to_trash = root1 / 'unique1.txt'
-
+        # Reading also proves the file exists
+        original_content = file_to_trash.read_bytes()
         initial_stack_size = len(tui.trash_stack)
+
         tui.trash_item(file_to_trash, 'file')
-        self.assertEqual(len(tui.trash_stack), initial_stack_size + 1)
 
-    def test_undo_restores_file(self):
-        """Undo should restore trashed file."""
-        tui, root1, root2 = self.create_tui_with_files()
-        file_to_trash = root1 / 'unique1.txt'
-        original_content = file_to_trash.read_text()
+        with self.subTest('trash moves file'):
+            self.assertFalse(file_to_trash.exists())
 
-        tui.trash_item(file_to_trash, 'file')
-        self.assertFalse(file_to_trash.exists())
+        with self.subTest('trash creates undo entry'):
+            self.assertEqual(len(tui.trash_stack), initial_stack_size + 1)
 
         tui.undo_last_trash()
-        self.assertTrue(file_to_trash.exists())
-        self.assertEqual(file_to_trash.read_text(), original_content)
+
+        with self.subTest('undo restores file'):
+            self.assertEqual(file_to_trash.read_bytes(), original_content)
 
 
 class TestCacheInvalidation(TempDirMixin, unittest.TestCase):
-    """Tests for cache invalidation."""
+    """Tests for in-memory cache invalidation."""
+
+    NEEDS_TEMPDIR = False
 
     def test_invalidate_all_caches_clears_caches(self):
         """invalidate_all_caches should clear all cache dictionaries."""
-        root = self.temp_dir / 'root'
-        root.mkdir()
-        (root / 'file.txt').write_text('content')
-
-        tui = TUI_MODULE.DedupdirTUI(root, use_cache=False)
-        tui.scan(quiet=True)
+        # Only the in-memory caches matter here: no files, no scan
+        tui = TUI_MODULE.DedupdirTUI(Path('/nonexistent'), use_cache=False)
 
         # Add test data to caches
         tui._recursive_stats_cache['test'] = 'data'
@@ -226,17 +430,17 @@ class TestCacheInvalidation(TempDirMixin, unittest.TestCase):
         self.assertEqual(len(tui._dir_contents_cache), 0)
         self.assertEqual(len(tui._dir_sizes_cache), 0)
 
+
+class TestRescan(TempDirMixin, unittest.TestCase):
+    """Tests for rescanning after filesystem changes."""
+
     def test_rescan_updates_after_external_changes(self):
         """Rescan should pick up external filesystem changes."""
         # Create two roots with duplicates so files get tracked
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
+        root1, root2 = self.root_paths('root1', 'root2')
 
         # Create duplicate files (needed for tracking in file_to_hash)
-        (root1 / 'dup.txt').write_text('duplicate content')
-        (root2 / 'dup.txt').write_text('duplicate content')
+        bulk_write({root1 / 'dup.txt': DUPLICATE_CONTENT, root2 / 'dup.txt': DUPLICATE_CONTENT})
 
         tui = TUI_MODULE.DedupdirTUI([root1, root2], use_cache=False)
         tui.scan(quiet=True)
@@ -245,7 +449,7 @@ class TestCacheInvalidation(TempDirMixin, unittest.TestCase):
         initial_total_files = sum(len(files) for files in tui.dir_all_files.values())
 
         # Add a new file externally
-        (root1 / 'new_file.txt').write_text('new content')
+        (root1 / 'new_file.txt').write_bytes(NEW_CONTENT)
 
         tui.rescan()
 
@@ -256,116 +460,201 @@ class TestCacheInvalidation(TempDirMixin, unittest.TestCase):
 class TestViewStack(TempDirMixin, unittest.TestCase):
     """Tests for view stack navigation."""
 
-    def create_tui(self):
-        """Create a basic TUI instance."""
-        root = self.temp_dir / 'root'
-        root.mkdir()
-        (root / 'file.txt').write_text('content')
-
-        tui = TUI_MODULE.DedupdirTUI(root, use_cache=False)
-        tui.scan(quiet=True)
-        return tui
-
-    def test_push_view_adds_to_stack(self):
-        """push_view should add view to stack."""
-        tui = self.create_tui()
-        initial_depth = len(tui.view_stack)
-        tui.push_view({'type': 'dir_detail', 'data': {'dir_path': Path('/test')}})
-        self.assertEqual(len(tui.view_stack), initial_depth + 1)
-
-    def test_pop_view_removes_from_stack(self):
-        """pop_view should remove view from stack."""
-        tui = self.create_tui()
-        tui.push_view({'type': 'dir_detail', 'data': {'dir_path': Path('/test')}})
-        depth_after_push = len(tui.view_stack)
+    FIXTURE_FILES = {
+        'root/file.txt': CONTENT,
+    }
+    SCAN_ROOTS = ('root',)
 
-        tui.pop_view()
-        self.assertEqual(len(tui.view_stack), depth_after_push - 1)
-
-    def test_pop_view_restores_selection(self):
-        """pop_view should restore previous selection state."""
-        tui = self.create_tui()
+    def test_push_and_pop_view(self):
+        """push_view/pop_view should grow/shrink the stack and save/restore selection."""
+        tui = self.tui
         tui.selected_idx = 5
         tui.scroll_offset = 2
+        initial_depth = len(tui.view_stack)
 
         tui.push_view({'type': 'dir_detail', 'data': {'dir_path': Path('/test')}})
 
-        # Selection resets on push
-        self.assertEqual(tui.selected_idx, 0)
-        self.assertEqual(tui.scroll_offset, 0)
+        with self.subTest('push adds to stack'):
+            self.assertEqual(len(tui.view_stack), initial_depth + 1)
+
+        with self.subTest('push resets selection'):
+            self.assertEqual(tui.selected_idx, 0)
+            self.assertEqual(tui.scroll_offset, 0)
 
         tui.pop_view()
 
-        # Selection restored on pop
-        self.assertEqual(tui.selected_idx, 5)
-        self.assertEqual(tui.scroll_offset, 2)
+        with self.subTest('pop removes from stack'):
+            self.assertEqual(len(tui.view_stack), initial_depth)
+
+        with self.subTest('pop restores selection'):
+            self.assertEqual(tui.selected_idx, 5)
+            self.assertEqual(tui.scroll_offset, 2)
 
 
 class TestConfirmationLogic(TempDirMixin, unittest.TestCase):
     """Tests for trash confirmation logic."""
 
-    def test_unique_file_needs_confirmation(self):
-        """File with count=1 should require confirmation."""
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
+    FIXTURE_FILES = {
+        'root1/duplicate.txt': DUPLICATE_CONTENT,
+        'root2/duplicate.txt': DUPLICATE_CONTENT,
+        'root1/unique.txt': UNIQUE1_CONTENT,
+    }
+    SCAN_ROOTS = ('root1', 'root2')
 
-        (root1 / 'duplicate.txt').write_text('dup')
-        (root2 / 'duplicate.txt').write_text('dup')
-        (root1 / 'unique.txt').write_text('unique')
+    def test_redundancy_count_decides_confirmation(self):
+        """Files with count<=1 need confirmation; files with count>1 don't."""
+        root1, root2 = self.root_paths('root1', 'root2')
+        tui = self.tui
 
-        tui = TUI_MODULE.DedupdirTUI([root1, root2], use_cache=False)
-        tui.scan(quiet=True)
+        with self.subTest('unique file needs confirmation'):
+            self.assertLessEqual(tui.get_file_redundancy_count(root1 / 'unique.txt'), 1)
 
-        unique_file = root1 / 'unique.txt'
-        count = tui.get_file_redundancy_count(unique_file)
+        with self.subTest('duplicate file needs no confirmation'):
+            self.assertGreater(tui.get_file_redundancy_count(root1 / 'duplicate.txt'), 1)
 
-        self.assertLessEqual(count, 1)
 
-    def test_duplicate_file_no_confirmation(self):
-        """File with count>1 should not require confirmation."""
-        root1 = self.temp_dir / 'root1'
-        root2 = self.temp_dir / 'root2'
-        root1.mkdir()
-        root2.mkdir()
+def iter_tests(suite):
+    """Yield the individual test cases in a (possibly nested) TestSuite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
 
-        (root1 / 'duplicate.txt').write_text('dup')
-        (root2 / 'duplicate.txt').write_text('dup')
 
-        tui = TUI_MODULE.DedupdirTUI([root1, root2], use_cache=False)
-        tui.scan(quiet=True)
+@functools.cache
+def all_tests():
+    """Return every test case in this module, loaded once per process."""
+    loader = unittest.TestLoader()
+    return tuple(iter_tests(loader.loadTestsFromModule(sys.modules[__name__])))
+
+
+class QuietResult(unittest.TextTestResult):
+    """TextTestResult that only reports problems unless running verbosely.
+
+    Without -v no per-test progress characters are written; failures and
+    errors are still reported in full by printErrors() at the end.
+    """
+
+    def __init__(self, stream, descriptions, verbosity, **kwargs):
+        super().__init__(stream, descriptions, verbosity, **kwargs)
+        self.dots = False
+
+
+class _BufferStream(io.StringIO):
+    """StringIO with the writeln() method TextTestResult expects."""
+
+    def writeln(self, line=''):
+        self.write(line + '\n')
+
 
-        dup_file = root1 / 'duplicate.txt'
-        count = tui.get_file_redundancy_count(dup_file)
+# Summary of one worker's test batch, as returned by _run_test_batch()
+BatchResult = collections.namedtuple('BatchResult', [
+    'tests_run', 'failures', 'errors', 'skipped', 'expected_failures',
+    'unexpected_successes', 'successful', 'progress', 'details',
+])
 
-        self.assertGreater(count, 1)
+
+def _run_test_batch(test_ids, verbosity):
+    """Run the given test ids in a worker process and return a BatchResult.
+
+    progress is the verbose per-test lines and details is the error report.
+    """
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    progress = _BufferStream()
+    result = QuietResult(progress, descriptions=True, verbosity=verbosity)
+    suite.run(result)
+    result.stream = details = _BufferStream()
+    if not result.wasSuccessful():
+        result.printErrors()
+    return BatchResult(
+        result.testsRun, len(result.failures), len(result.errors), len(result.skipped),
+        len(result.expectedFailures), len(result.unexpectedSuccesses), result.wasSuccessful(),
+        progress.getvalue(), details.getvalue().lstrip('\n'))
+
+
+def run_parallel(suite, verbosity, jobs):
+    """Run suite across worker processes, one batch per TestCase class.
+
+    Batching by class keeps each class's setUpClass fixtures shared. Both
+    dedupdir modules are loaded before forking so workers inherit them.
+    """
+    batches = {}
+    for test in iter_tests(suite):
+        batches.setdefault(type(test), []).append(test.id())
+
+    DEDUPDIR._load()
+    TUI_MODULE._load()
+
+    start = time.perf_counter()
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=min(jobs, len(batches)), mp_context=context) as executor:
+        results = list(executor.map(_run_test_batch, batches.values(), [verbosity] * len(batches)))
+    elapsed = time.perf_counter() - start
+
+    def total(field):
+        return sum(getattr(r, field) for r in results)
+
+    tests_run = total('tests_run')
+    successful = all(r.successful for r in results)
+
+    stream = sys.stderr
+    progress = ''.join(r.progress for r in results)
+    if progress:
+        stream.write(progress + '\n')
+    stream.write(''.join(r.details for r in results))
+    stream.write('-' * 70 + '\n')
+    stream.write(f"Ran {tests_run} test{'s' if tests_run != 1 else ''} in {elapsed:.3f}s\n\n")
+
+    # Same counts and wording as unittest.TextTestRunner's summary line
+    details = []
+    for field, label in (('failures', 'failures'), ('errors', 'errors'), ('skipped', 'skipped'),
+                         ('expected_failures', 'expected failures'),
+                         ('unexpected_successes', 'unexpected successes')):
+        count = total(field)
+        if count:
+            details.append(f"{label}={count}")
+    status = 'OK' if successful else 'FAILED'
+    stream.write(f"{status} ({', '.join(details)})\n" if details else f"{status}\n")
+    return successful
 
 
 def main():
     # Parse arguments
     verbosity = 2 if '-v' in sys.argv else 1
+    jobs = os.cpu_count() or 1
 
     # Remove our flags from argv so unittest doesn't see them
-    argv = [arg for arg in sys.argv if arg not in ['-v']]
+    argv = []
+    args = iter(sys.argv)
+    for arg in args:
+        if arg == '-v':
+            continue
+        if arg.startswith('-j'):
+            try:
+                jobs = int(arg[2:] or next(args))
+            except (ValueError, StopIteration):
+                print(f"Invalid job count in '{arg}'")
+                return 1
+            continue
+        argv.append(arg)
 
     # Discover and run tests
-    loader = unittest.TestLoader()
-
     if len(argv) > 1:
-        # Run specific test(s)
-        suite = unittest.TestSuite()
-        for pattern in argv[1:]:
-            try:
-                suite.addTests(loader.loadTestsFromName(pattern, module=sys.modules[__name__]))
-            except Exception as e:
-                print(f"Error loading test '{pattern}': {e}")
-                return 1
+        # Run tests whose id matches any of the given patterns
+        pattern_re = re.compile('|'.join(re.escape(pattern) for pattern in argv[1:]))
+        suite = unittest.TestSuite(test for test in all_tests() if pattern_re.search(test.id()))
+        if not suite.countTestCases():
+            print(f"No tests match: {' '.join(argv[1:])}")
+            return 1
     else:
         # Run all tests
-        suite = loader.loadTestsFromModule(sys.modules[__name__])
+        suite = unittest.TestSuite(all_tests())
+
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        return 0 if run_parallel(suite, verbosity, jobs) else 1
 
-    runner = unittest.TextTestRunner(verbosity=verbosity)
+    runner = unittest.TextTestRunner(verbosity=verbosity, resultclass=QuietResult)
     result = runner.run(suite)
 
     return 0 if result.wasSuccessful() else 1